@@ -1,26 +1,102 @@
 """The Swiss Weather integration."""
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
 import logging
+from typing import Any, Hashable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
-from .coordinator import SwissWeatherDataCoordinator
+from .const import CONF_POST_CODE, CONF_STATION_CODE, DOMAIN
+from .coordinator import (
+    SwissCurrentStateCoordinator,
+    SwissWeatherDataCoordinator,
+    get_current_coordinator_key,
+    get_device_info_key,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.WEATHER]
 
+# hass.data[DOMAIN] keys of coordinators shared between config entries.
+_FORECAST_COORDINATORS = "_forecast_coordinators"
+_CURRENT_COORDINATORS = "_current_coordinators"
+
+@dataclass
+class _SharedCoordinator:
+    """Coordinator used by all config entries polling the same location.
+
+    It isn't bound to the config entry that created it, it's shut down once
+    the last entry using it is unloaded.
+    """
+
+    coordinator: DataUpdateCoordinator[Any]
+    # Awaited by every entry joining, so none of them starts without data.
+    first_refresh: asyncio.Task[None]
+    entry_ids: set[str] = field(default_factory=set)
+
+def _build_device_info(post_code: str, station_code: str | None) -> DeviceInfo:
+    if station_code is None:
+        id_combo = f"{post_code}"
+    else:
+        id_combo = f"{post_code}-{station_code}"
+    return DeviceInfo(entry_type=DeviceEntryType.SERVICE, name=f"MeteoSwiss at {id_combo}", identifiers={(DOMAIN, f"swissweather-{id_combo}")})
+
+async def _async_first_refresh(coordinator: DataUpdateCoordinator[Any],
+                               previous: asyncio.Task[None] | None = None) -> None:
+    if previous is not None:
+        await previous
+    await coordinator.async_refresh()
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Swiss Weather from a config entry."""
 
-    coordinator = SwissWeatherDataCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    post_code = entry.data[CONF_POST_CODE]
+    station_code = entry.data.get(CONF_STATION_CODE)
+
+    # Entries for the same location share coordinators so MeteoSwiss is polled only once.
+    forecast_coordinators = domain_data.setdefault(_FORECAST_COORDINATORS, {})
+    current_coordinators = domain_data.setdefault(_CURRENT_COORDINATORS, {})
+    if (shared_forecast := forecast_coordinators.get(post_code)) is None:
+        coordinator = SwissWeatherDataCoordinator(hass, entry)
+        shared_forecast = forecast_coordinators[post_code] = _SharedCoordinator(
+            coordinator, hass.async_create_task(_async_first_refresh(coordinator)))
+    coordinator = shared_forecast.coordinator
+    if (shared_current := current_coordinators.get((post_code, station_code))) is None:
+        current_coordinator = SwissCurrentStateCoordinator(hass, entry, coordinator)
+        # Without a station the current state is derived from forecast data,
+        # so the forecast has to be loaded first. Otherwise both load at once and
+        # a fallback state is re-derived once the forecast arrives.
+        previous = shared_forecast.first_refresh if station_code is None else None
+        shared_current = current_coordinators[(post_code, station_code)] = _SharedCoordinator(
+            current_coordinator,
+            hass.async_create_task(_async_first_refresh(current_coordinator, previous)))
+    current_coordinator = shared_current.coordinator
+    shared_forecast.entry_ids.add(entry.entry_id)
+    shared_current.entry_ids.add(entry.entry_id)
+
+    try:
+        for shared in (shared_forecast, shared_current):
+            # Shielded, other entries may be waiting for the same refresh.
+            await asyncio.shield(shared.first_refresh)
+            if not shared.coordinator.last_update_success:
+                raise ConfigEntryNotReady from shared.coordinator.last_exception
+    except BaseException:
+        await _async_release_shared_coordinators(domain_data, entry)
+        raise
+    domain_data[entry.entry_id] = coordinator
+    domain_data[get_current_coordinator_key(entry.entry_id)] = current_coordinator
+    # Built once here, so sensors and the weather entity of this entry share it.
+    domain_data[get_device_info_key(entry.entry_id)] = _build_device_info(post_code, station_code)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -30,4 +106,26 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
-    return unload_ok
\ No newline at end of file
+        hass.data[DOMAIN].pop(get_current_coordinator_key(entry.entry_id))
+        hass.data[DOMAIN].pop(get_device_info_key(entry.entry_id))
+        await _async_release_shared_coordinators(hass.data[DOMAIN], entry)
+    return unload_ok
+
+async def _async_release_shared_coordinators(domain_data: dict[str, Any], entry: ConfigEntry) -> None:
+    post_code = entry.data[CONF_POST_CODE]
+    station_code = entry.data.get(CONF_STATION_CODE)
+    # Current state coordinators listen to the forecast one, so they go first.
+    await _async_release_shared_coordinator(
+        domain_data[_CURRENT_COORDINATORS], (post_code, station_code), entry.entry_id)
+    await _async_release_shared_coordinator(
+        domain_data[_FORECAST_COORDINATORS], post_code, entry.entry_id)
+
+async def _async_release_shared_coordinator(coordinators: dict[Hashable, _SharedCoordinator],
+                                            key: Hashable, entry_id: str) -> None:
+    shared = coordinators.get(key)
+    if shared is None:
+        return
+    shared.entry_ids.discard(entry_id)
+    if not shared.entry_ids:
+        coordinators.pop(key)
+        await shared.coordinator.async_shutdown()
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import math
+import time
 from typing import Any
 
-import requests
+from aiohttp import ClientTimeout
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
     SelectOptionDict,
     SelectSelector,
@@ -23,6 +26,16 @@ from .const import CONF_POST_CODE, CONF_STATION_CODE, DOMAIN
 
 STATION_LIST_URL = "https://data.geo.admin.ch/ch.meteoschweiz.messnetz-automatisch/ch.meteoschweiz.messnetz-automatisch_en.csv"
 
+# The station list changes very rarely, so keep parsed lists around between
+# config flow invocations instead of downloading them for every form render.
+STATION_CACHE_TTL_S = 6 * 60 * 60
+
+STATION_LIST_TIMEOUT = ClientTimeout(total=30, connect=10)
+
+# Columns of the station list we read, looked up in the header once per download.
+STATION_LIST_COLUMNS = ("Abbr.", "Station", "Measurements", "Station height m a. sea level",
+                        "Latitude", "Longitude", "Canton")
+
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA_BACKUP = vol.Schema(
@@ -43,6 +56,20 @@ class WeatherStation:
     lng: float
     canton: str
 
+@dataclass
+class _StationListCacheEntry:
+    """Parsed station list together with data needed to revalidate it."""
+
+    fetched_at: float # time.monotonic() of the last download or revalidation
+    stations: list[WeatherStation]
+    etag: str | None
+    last_modified: str | None
+    # Formatted dropdown options keyed by home coordinates, since they determine the ordering.
+    options: dict[tuple[float | None, float | None], list[SelectOptionDict]] = field(default_factory=dict)
+
+# Parsed station lists keyed by URL.
+_STATION_CACHE: dict[str, _StationListCacheEntry] = {}
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Swiss Weather."""
 
@@ -54,14 +81,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the initial step."""
         if user_input is None:
             try:
-                stations = await self.hass.async_add_executor_job(self.load_station_list)
+                stations = await self.load_station_list()
                 _LOGGER.debug("Stations received.", extra={"Stations": stations})
-                if (self.hass.config.latitude is not None and
-                    self.hass.config.longitude is not None):
-                        stations = sorted(stations, key=lambda it: self._get_distance_to_station(it))
-                options = [SelectOptionDict(value=station.code,
-                                            label=self.format_station_name_for_dropdown(station))
-                                            for station in stations]
+                options = self._get_weather_station_options(stations)
                 schema = vol.Schema({
                     vol.Required(CONF_POST_CODE): str,
                     vol.Optional(CONF_STATION_CODE): SelectSelector(
@@ -87,12 +109,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_create_entry(title="Swiss Weather", data=user_input,
             description=f"{user_input[CONF_POST_CODE]} / {station_code}")
 
-    def format_station_name_for_dropdown(self, station: WeatherStation) -> str:
-        distance = self._get_distance_to_station(station)
-        if distance is None:
+    def _get_weather_station_options(self, stations: list[WeatherStation]) -> list[SelectOptionDict]:
+        entry = _STATION_CACHE.get(STATION_LIST_URL)
+        if entry is None or entry.stations is not stations:
+            return self._build_weather_station_options(stations)
+        home = (self.hass.config.latitude, self.hass.config.longitude)
+        if (options := entry.options.get(home)) is None:
+            options = entry.options[home] = self._build_weather_station_options(stations)
+        return options
+
+    def _build_weather_station_options(self, stations: list[WeatherStation]) -> list[SelectOptionDict]:
+        # Distance is needed for both ordering and the label, so compute it only once per station.
+        distances = {station.code: self._get_distance_to_station(station) for station in stations}
+        if (self.hass.config.latitude is not None and
+            self.hass.config.longitude is not None):
+                # Don't sort in place, the list is shared with the station cache.
+                stations = sorted(stations, key=lambda it: distances[it.code] if distances[it.code] is not None else math.inf)
+        return [SelectOptionDict(value=station.code,
+                                 label=self.format_station_name_for_dropdown(station, distances[station.code]))
+                                 for station in stations]
+
+    def format_station_name_for_dropdown(self, station: WeatherStation, distance_m: float | None = None) -> str:
+        if distance_m is None:
+            distance_m = self._get_distance_to_station(station)
+        if distance_m is None:
             return f"{station.name} ({station.canton})"
         else:
-            return f"{station.name} ({station.canton}) - {distance / 1000:.0f} km away"
+            return f"{station.name} ({station.canton}) - {distance_m / 1000:.0f} km away"
 
     def _get_distance_to_station(self, station: WeatherStation):
         h_lat = self.hass.config.latitude
@@ -101,35 +144,69 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return None
         return distance(h_lat, h_lng, station.lat, station.lng)
 
-    def load_station_list(self, encoding='ISO-8859-1') -> list[WeatherStation]:
+    async def load_station_list(self, encoding='ISO-8859-1') -> list[WeatherStation]:
+        entry = _STATION_CACHE.get(STATION_LIST_URL)
+        if entry is not None and time.monotonic() - entry.fetched_at < STATION_CACHE_TTL_S:
+            _LOGGER.debug("Using cached station list.")
+            return entry.stations
+        headers = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
         _LOGGER.info("Requesting station list data...")
-        with requests.get(STATION_LIST_URL, stream = True) as r:
-            lines = (line.decode(encoding) for line in r.iter_lines())
-            reader = csv.DictReader(lines, delimiter=';')
-            stations = []
-            for row in reader:
+        session = async_get_clientsession(self.hass)
+        async with session.get(STATION_LIST_URL, headers=headers, timeout=STATION_LIST_TIMEOUT) as r:
+            if r.status == 304 and entry is not None:
+                _LOGGER.debug("Station list not modified, using cached list.")
+                entry.fetched_at = time.monotonic()
+                return entry.stations
+            r.raise_for_status()
+            body = await r.read()
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+        raw_lines = body.splitlines()
+        if not raw_lines:
+            raise ValueError("Station list is empty.")
+        header = next(csv.reader([raw_lines[0].decode(encoding)], delimiter=';'))
+        # Most stations don't measure temperature and get skipped anyway, so drop
+        # their lines before paying for decoding and CSV splitting.
+        reader = csv.reader((line.decode(encoding) for line in raw_lines[1:] if b"Temperature" in line),
+                            delimiter=';')
+        idx = {name: header.index(name) for name in STATION_LIST_COLUMNS}
+        min_row_length = max(idx.values()) + 1
+        stations = []
+        log_rows = _LOGGER.isEnabledFor(logging.DEBUG)
+        for row in reader:
+            if log_rows:
                 _LOGGER.debug(row)
-                code =  row.get("Abbr.")
-                if code is None:
-                    _LOGGER.debug("No code in row.", extra={"Station": row})
-                    continue
-                # Skip stations that have almost no useable data
-                measurements = row.get("Measurements")
-                if measurements is None:
-                    _LOGGER.debug("No measurements in row.", extra={"Station": row})
-                    continue
-                if "Temperature" not in measurements:
-                    _LOGGER.debug("Skipping station due to lack of data.", extra={"Station": row})
-                    continue
-
-                stations.append(WeatherStation(row.get("Station"),
-                                               row.get("Abbr."),
-                                               _int_or_none(row.get("Station height m a. sea level")),
-                                               _float_or_none(row.get("Latitude")),
-                                               _float_or_none(row.get("Longitude")),
-                                               row.get("Canton")))
-            _LOGGER.info("Retrieved %d stations.", len(stations))
-            return stations
+            if len(row) < min_row_length:
+                _LOGGER.debug("Incomplete row.", extra={"Station": row})
+                continue
+            code = row[idx["Abbr."]] or None
+            measurements = row[idx["Measurements"]] or None
+            if code is None:
+                _LOGGER.debug("No code in row.", extra={"Station": row})
+                continue
+            # Skip stations that have almost no useable data
+            if measurements is None:
+                _LOGGER.debug("No measurements in row.", extra={"Station": row})
+                continue
+            if "Temperature" not in measurements:
+                _LOGGER.debug("Skipping station due to lack of data.", extra={"Station": row})
+                continue
+
+            stations.append(WeatherStation(row[idx["Station"]],
+                                           code,
+                                           _int_or_none(row[idx["Station height m a. sea level"]]),
+                                           _float_or_none(row[idx["Latitude"]]),
+                                           _float_or_none(row[idx["Longitude"]]),
+                                           row[idx["Canton"]]))
+        _LOGGER.info("Retrieved %d stations.", len(stations))
+        _STATION_CACHE[STATION_LIST_URL] = _StationListCacheEntry(time.monotonic(), stations,
+                                                                  etag, last_modified)
+        return stations
 
 def _int_or_none(val: str) -> int|None:
     if val is None:
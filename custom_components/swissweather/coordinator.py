@@ -1,56 +1,136 @@
 """Coordinates updates for weather data."""
 
-import datetime
-from datetime import timedelta
+import dataclasses
+from datetime import datetime, timedelta
+import hashlib
 import logging
-from random import randrange
-from typing import Tuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import CONF_POST_CODE, CONF_STATION_CODE, DOMAIN
-from .meteo import CurrentState, CurrentWeather, MeteoClient, WeatherForecast
+from .meteo import CurrentWeather, MeteoClient, WeatherForecast
 
 _LOGGER = logging.getLogger(__name__)
 
-class SwissWeatherDataCoordinator(DataUpdateCoordinator[Tuple[CurrentState, WeatherForecast]]):
-    """Coordinates data loads for all sensors."""
+# hass.data[DOMAIN] key of the MeteoClient shared by all coordinators.
+_CLIENT = "_client"
+
+# Template for current state derived from the forecast, which only knows the temperature.
+_EMPTY_CURRENT = CurrentWeather(None, None, *([None] * 12))
+
+def _build_fallback_current(date: datetime | None, air_temperature: float | None) -> CurrentWeather:
+    return dataclasses.replace(_EMPTY_CURRENT, date=date, airTemperature=air_temperature)
+
+def _get_update_interval(config_entry: ConfigEntry, min_minutes: int, max_minutes: int) -> timedelta:
+    """Returns an update interval between min and max minutes (inclusive).
+
+    The interval is derived from the entry id so it stays the same across restarts.
+    """
+    digest = hashlib.blake2b(config_entry.entry_id.encode(), digest_size=2).hexdigest()
+    return timedelta(minutes=min_minutes + int(digest, 16) % (max_minutes - min_minutes + 1))
+
+def _get_client(hass: HomeAssistant) -> MeteoClient:
+    """Returns the MeteoClient shared by all coordinators, so they also share its caches."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (client := domain_data.get(_CLIENT)) is None:
+        client = domain_data[_CLIENT] = MeteoClient(async_get_clientsession(hass))
+    return client
+
+def get_current_coordinator_key(entry_id: str) -> str:
+    """Returns the hass.data key of the current state coordinator for a config entry."""
+    return f"{entry_id}_current"
+
+def get_device_info_key(entry_id: str) -> str:
+    """Returns the hass.data key of the device info shared by entities of a config entry."""
+    return f"{entry_id}_device_info"
+
+class SwissWeatherDataCoordinator(DataUpdateCoordinator[WeatherForecast]):
+    """Coordinates forecast data loads for the weather entity."""
 
     _client : MeteoClient = None
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-        self._station_code = config_entry.data.get(CONF_STATION_CODE)
         self._post_code = config_entry.data[CONF_POST_CODE]
-        self._client = MeteoClient()
-        update_interval = timedelta(minutes=10)
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval,
-                         always_update=False)
+        self._client = _get_client(hass)
+        update_interval = _get_update_interval(config_entry, 55, 65)
+        # Shared by all entries for the post code, so it isn't bound to the one creating it.
+        super().__init__(hass, _LOGGER, config_entry=None, name=DOMAIN,
+                         update_interval=update_interval, always_update=False)
+
+    async def _async_update_data(self) -> WeatherForecast:
+        try:
+            _LOGGER.info("Loading current forecast for %s", self._post_code)
+            current_forecast = await self._client.get_forecast(self._post_code)
+            _LOGGER.debug("Current forecast: %s", current_forecast)
+        except Exception as e:
+            _LOGGER.exception(e)
+            raise UpdateFailed(f"Update failed: {e}") from e
+        if current_forecast is None:
+            raise UpdateFailed("Forecast could not be loaded")
+        return current_forecast
 
-    async def _async_update_data(self) -> Tuple[CurrentState, WeatherForecast]:
+class SwissCurrentStateCoordinator(DataUpdateCoordinator[CurrentWeather | None]):
+    """Coordinates current weather state loads for all sensors.
+
+    Measurements of the weather station change much more often than the forecast,
+    so they're polled on their own, shorter, interval. If no station is configured
+    (or it can't be loaded), the current state is derived from the latest forecast
+    and follows its updates.
+    """
+
+    _client : MeteoClient = None
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry,
+                 forecast_coordinator: SwissWeatherDataCoordinator) -> None:
+        self._station_code = config_entry.data.get(CONF_STATION_CODE)
+        self._forecast_coordinator = forecast_coordinator
+        self._uses_forecast = False
+        self._client = _get_client(hass)
+        update_interval = _get_update_interval(config_entry, 9, 11)
+        # Shared by all entries for the location, so it isn't bound to the one creating it.
+        super().__init__(hass, _LOGGER, config_entry=None, name=f"{DOMAIN}_current",
+                         update_interval=update_interval, always_update=False)
+        self._remove_forecast_listener: CALLBACK_TYPE | None = forecast_coordinator.async_add_listener(
+            self._handle_forecast_update)
+
+    async def async_shutdown(self) -> None:
+        if self._remove_forecast_listener is not None:
+            self._remove_forecast_listener()
+            self._remove_forecast_listener = None
+        await super().async_shutdown()
+
+    @callback
+    def _handle_forecast_update(self) -> None:
+        """Re-derives the current state when it comes from the forecast."""
+        if not self._uses_forecast:
+            return
+        current_state = self._get_current_state_from_forecast()
+        if current_state != self.data:
+            self.async_set_updated_data(current_state)
+
+    async def _async_update_data(self) -> CurrentWeather | None:
+        current_state = None
         if self._station_code is None:
             _LOGGER.warning("Station code not set, not loading current state.")
-            current_state = None
         else:
             _LOGGER.info("Loading current weather state for %s", self._station_code)
             try:
-                current_state = await self.hass.async_add_executor_job(
-                    self._client.get_current_weather_for_station, self._station_code)
+                current_state = await self._client.get_current_weather_for_station(self._station_code)
                 _LOGGER.debug("Current state: %s", current_state)
             except Exception as e:
                 _LOGGER.exception(e)
-                current_state = None
 
-        try:
-            _LOGGER.info("Loading current forecast for %s", self._post_code)
-            current_forecast = await self.hass.async_add_executor_job(self._client.get_forecast, self._post_code)
-            _LOGGER.debug("Current forecast: %s", current_forecast)
-            if current_state is None:
-                current = current_forecast.current
-                noValue = (None, None)
-                current_state = CurrentWeather(None, datetime.datetime.now(tz=datetime.UTC), current.currentTemperature, noValue, noValue, noValue, noValue, noValue, noValue, noValue, noValue, noValue, noValue, noValue)
-        except Exception as e:
-            _LOGGER.exception(e)
-            raise UpdateFailed(f"Update failed: {e}") from e
-        return (current_state, current_forecast)
+        self._uses_forecast = current_state is None
+        if current_state is None:
+            current_state = self._get_current_state_from_forecast()
+        return current_state
+
+    def _get_current_state_from_forecast(self) -> CurrentWeather | None:
+        forecast = self._forecast_coordinator.data
+        if forecast is None or forecast.current is None:
+            return None
+        # Uses the forecast's own time so an unchanged forecast yields an equal state.
+        return _build_fallback_current(forecast.current.currentTime, forecast.current.currentTemperature)
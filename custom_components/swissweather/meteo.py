@@ -1,18 +1,44 @@
+import asyncio
 import csv
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-import itertools
+import functools
+import hashlib
+import json
 import logging
-from typing import List, NewType
+import sys
+import time
+from types import MappingProxyType
+from typing import List, Mapping
 
-import requests
+import aiohttp
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 CURRENT_CONDITION_URL= 'https://data.geo.admin.ch/ch.meteoschweiz.messwerte-aktuell/VQHA80.csv'
+# MeteoSwiss refreshes current conditions every 10 minutes. Stays below the shortest
+# current state poll interval (9 minutes), so each poll revalidates the data while
+# coordinators of other stations polling in between reuse it.
+CURRENT_CONDITION_TTL_S = 8 * 60
+# Columns of the current conditions CSV read by the client.
+CURRENT_CONDITION_COLUMNS = ('Station/Location', 'Date', 'tre200s0', 'rre150z0', 'sre000z0', 'gre000z0',
+                             'ure200s0', 'tde200s0', 'dkl010z0', 'fu3010z0', 'fu3010z1', 'prestas0',
+                             'pp0qffs0', 'pp0qnhs0')
 
 FORECAST_URL= "https://app-prod-ws.meteoswiss-app.ch/v1/plzDetail?plz={:<06d}"
 FORECAST_USER_AGENT = "android-31 ch.admin.meteoswiss-2160000"
+# Only coalesces requests for the same post code made close together (e.g. a reload or
+# manual refresh right after a poll). It doesn't span the hourly polls, unchanged
+# payloads of those are detected by get_forecast's digest instead.
+FORECAST_TTL_S = 300
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
 
 CONDITION_CLASSES = {
     "clear-night": [101],
@@ -32,32 +58,64 @@ CONDITION_CLASSES = {
     "exceptional": [],
 }
 
-ICON_TO_CONDITION_MAP : dict[int, str] =  {i: k for k, v in CONDITION_CLASSES.items() for i in v}
+# Read-only, so the conditions handed out to every forecast entry can't be altered by accident.
+ICON_TO_CONDITION_MAP : Mapping[int, str] = MappingProxyType(
+    {i: sys.intern(k) for k, v in CONDITION_CLASSES.items() for i in v})
+
+# Icon codes are small integers, so conditions are looked up by index instead of hashing.
+_ICON_LUT: tuple[str | None, ...] = tuple(ICON_TO_CONDITION_MAP.get(i)
+                                          for i in range(max(ICON_TO_CONDITION_MAP) + 1))
+
+def icon_to_condition(icon: int | None) -> str | None:
+    """Returns the condition for a MeteoSwiss icon code, or None if it's unknown."""
+    if isinstance(icon, int) and 0 <= icon < len(_ICON_LUT):
+        return _ICON_LUT[icon]
+    return None
+
+# Values MeteoSwiss uses for missing measurements. These are common in the CSV,
+# so they're rejected up front instead of through a raised ValueError.
+_EMPTY_VALUES = frozenset((None, '', '-', '–'))
 
 """
 Returns float or None
 """
 def to_float(string: str) -> float | None:
-    if string is None:
+    if string in _EMPTY_VALUES:
         return None
 
     try:
         return float(string)
     except ValueError:
+        logger.debug("Unparseable float value %s", string)
         return None
 
 def to_int(string: str) -> int | None:
-    if string is None:
+    if string in _EMPTY_VALUES:
         return None
 
     try:
         return int(string)
     except ValueError:
+        logger.debug("Unparseable int value %s", string)
         return None
 
-FloatValue = NewType('FloatValue', tuple[float | None, str])
+# All rows of a current conditions CSV usually share the same measurement time.
+@functools.lru_cache(maxsize=32)
+def _parse_yyyymmddhhmm(string: str) -> datetime:
+    """Parses MeteoSwiss YYYYMMDDHHmm UTC timestamps without going through strptime."""
+    return datetime(int(string[0:4]), int(string[4:6]), int(string[6:8]),
+                    int(string[8:10]), int(string[10:12]), tzinfo=UTC)
 
-@dataclass
+@functools.lru_cache(maxsize=64)
+def _forecast_url(postCode: int) -> str:
+    return FORECAST_URL.format(postCode)
+
+def _parse_epoch_ms_list(epochs: list[int]) -> list[datetime]:
+    """Converts a list of millisecond UTC epochs, as used in forecast JSON, to datetimes."""
+    fromtimestamp = datetime.fromtimestamp
+    return [fromtimestamp(epoch / 1000, UTC) for epoch in epochs]
+
+@dataclass(slots=True)
 class StationInfo:
     name: str
     abbreviation: str
@@ -70,44 +128,56 @@ class StationInfo:
     def __str__(self) -> str:
         return f"Station {self.abbreviation} - [Name: {self.name}, Lat: {self.lat}, Lng: {self.lng}, Canton: {self.canton}]"
 
-@dataclass
+@dataclass(slots=True)
 class CurrentWeather:
     station: StationInfo
     date: datetime
-    airTemperature: FloatValue
-    precipitation: FloatValue
-    sunshine: FloatValue
-    globalRadiation: FloatValue
-    relativeHumidity: FloatValue
-    dewPoint: FloatValue
-    windDirection: FloatValue
-    windSpeed: FloatValue
-    gustPeak1s: FloatValue
-    pressureStationLevel: FloatValue
-    pressureSeaLevel: FloatValue
-    pressureSeaLevelAtStandardAtmosphere: FloatValue
-
-@dataclass
+    airTemperature: float | None
+    precipitation: float | None
+    sunshine: float | None
+    globalRadiation: float | None
+    relativeHumidity: float | None
+    dewPoint: float | None
+    windDirection: float | None
+    windSpeed: float | None
+    gustPeak1s: float | None
+    pressureStationLevel: float | None
+    pressureSeaLevel: float | None
+    pressureSeaLevelAtStandardAtmosphere: float | None
+
+@dataclass(slots=True)
 class CurrentState:
-    currentTemperature: FloatValue
+    currentTemperature: float | None # °C
     currentIcon: int
     currentCondition: str | None # None if icon is unrecognized.
+    currentTime: datetime | None = None # Time the current state was published at.
 
-@dataclass
+@dataclass(slots=True)
 class Forecast:
     timestamp: datetime
     icon: int
     condition: str | None # None if icon is unrecognized.
-    temperatureMax: FloatValue
-    temperatureMin: FloatValue
-    precipitation: FloatValue
+    temperatureMax: float | None
+    temperatureMin: float | None
+    precipitation: float | None
     # Only available for hourly forecast
-    temperatureMean: FloatValue | None = None
-    windSpeed: FloatValue | None = None
-    windDirection: FloatValue | None = None
-    windGustSpeed: FloatValue | None = None
+    temperatureMean: float | None = None
+    windSpeed: float | None = None
+    windDirection: float | None = None
+    windGustSpeed: float | None = None
 
 @dataclass
+class _CsvResponse:
+    header: list[str]
+    rows: list[list[str]]
+    # Validators sent back to the server on the next request for the same file.
+    etag: str | None = None
+    last_modified: str | None = None
+
+# Returned instead of a parsed file when the server reports it unchanged.
+_CSV_NOT_MODIFIED = _CsvResponse([], [])
+
+@dataclass(slots=True)
 class WeatherForecast(object):
     current: CurrentState
     dailyForecast: list[Forecast]
@@ -121,59 +191,104 @@ class MeteoClient(object):
     """
     Initializes the client.
 
-    Languages available are en, de, fr and it.
+    All requests go through the passed aiohttp session, which is owned (and closed)
+    by the caller. Languages available are en, de, fr and it.
     """
-    def __init__(self, language="en"):
+    def __init__(self, session: aiohttp.ClientSession, language="en"):
+        self._session = session
         self.language = language
-
-    def get_current_weather_for_all_stations(self) -> list[CurrentWeather] | None:
+        # Time of retrieval and rows of the last current conditions CSV.
+        self._csv_cache: tuple[float, list[list[str]]] | None = None
+        # ETag and Last-Modified of the cached CSV, used to revalidate it.
+        self._csv_etag: str | None = None
+        self._csv_last_modified: str | None = None
+        # Positions of CURRENT_CONDITION_COLUMNS (if present) in the cached CSV rows.
+        self._csv_columns: dict[str, int] = {}
+        # Rows of the cached CSV keyed by casefolded station code.
+        self._station_index: dict[str, list[str]] = {}
+        # Makes concurrent callers wait for a single download of the CSV.
+        self._csv_lock = asyncio.Lock()
+        # Forecast response body and its monotonic expiry time keyed by (post code, language).
+        self._forecast_cache: dict[tuple[int, str], tuple[float, bytes]] = {}
+        self._forecast_locks: dict[tuple[int, str], asyncio.Lock] = {}
+        # Digest of the last parsed forecast body and the forecast built from it.
+        self._forecast_results: dict[tuple[int, str], tuple[bytes, WeatherForecast]] = {}
+
+    async def get_current_weather_for_all_stations(self) -> list[CurrentWeather] | None:
         logger.debug("Retrieving current weather for all stations ...")
-        data = self._get_csv_dictionary_for_url(CURRENT_CONDITION_URL)
-        weather = []
-        for row in data:
-            weather.append(self._get_current_data_for_row(row))
-        return weather
+        data = await self._get_current_condition_rows()
+        if data is None:
+            return None
+        columns = self._csv_columns
+        return [self._get_current_data_for_row(row, columns) for row in data]
 
-    def get_current_weather_for_station(self, station: str) -> CurrentWeather | None:
+    async def get_current_weather_for_station(self, station: str) -> CurrentWeather | None:
         logger.debug("Retrieving current weather...")
-        data = self._get_current_weather_line_for_station(station)
+        data = await self._get_current_weather_line_for_station(station)
         if data is None:
             logger.warning("Couldn't find data for station %s", station)
             return None
 
-        return self._get_current_data_for_row(data)
+        return self._get_current_data_for_row(data, self._csv_columns)
+
+    def _get_current_data_for_row(self, csv_row: list[str], columns: dict[str, int]) -> CurrentWeather:
+        def column(name):
+            index = columns.get(name)
+            if index is None or index >= len(csv_row):
+                return None
+            return csv_row[index]
 
-    def _get_current_data_for_row(self, csv_row) -> CurrentWeather:
         timestamp = None
-        timestamp_raw = csv_row.get('Date', None)
+        timestamp_raw = column('Date')
         if timestamp_raw is not None:
-            timestamp = datetime.strptime(timestamp_raw, '%Y%m%d%H%M').replace(tzinfo=UTC)
+            timestamp = _parse_yyyymmddhhmm(timestamp_raw)
 
         return CurrentWeather(
-            csv_row.get('Station/Location'),
+            column('Station/Location'),
             timestamp,
-            (to_float(csv_row.get('tre200s0', None)), "°C") ,
-            (to_float(csv_row.get('rre150z0', None)), "mm"),
-            (to_float(csv_row.get('sre000z0', None)), "min"),
-            (to_float(csv_row.get('gre000z0', None)), "W/m²"),
-            (to_float(csv_row.get('ure200s0', None)), '%'),
-            (to_float(csv_row.get('tde200s0', None)), '°C'),
-            (to_float(csv_row.get('dkl010z0', None)), '°'),
-            (to_float(csv_row.get('fu3010z0', None)), 'km/h'),
-            (to_float(csv_row.get('fu3010z1', None)), 'km/h'),
-            (to_float(csv_row.get('prestas0', None)), 'hPa'),
-            (to_float(csv_row.get('prestas0', None)), 'hPa'),
-            (to_float(csv_row.get('pp0qnhs0', None)), 'hPa'),
+            to_float(column('tre200s0')),
+            to_float(column('rre150z0')),
+            to_float(column('sre000z0')),
+            to_float(column('gre000z0')),
+            to_float(column('ure200s0')),
+            to_float(column('tde200s0')),
+            to_float(column('dkl010z0')),
+            to_float(column('fu3010z0')),
+            to_float(column('fu3010z1')),
+            to_float(column('prestas0')),
+            to_float(column('pp0qffs0')),
+            to_float(column('pp0qnhs0')),
         )
 
 
     ## Forecast
-    def get_forecast(self, postCode) -> WeatherForecast | None:
-        forecastJson = self._get_forecast_json(postCode, self.language)
-        logger.debug("Forecast JSON: %s", forecastJson)
-        if forecastJson is None:
+    async def get_forecast(self, postCode) -> WeatherForecast | None:
+        key = (int(postCode), self.language)
+        payload = await self._get_forecast_payload(*key)
+        if payload is None:
             return None
+        # MeteoSwiss publishes new forecasts less often than we poll. Returning the same
+        # object for an unchanged body skips parsing and makes the coordinator's
+        # equality check trivial.
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        previous = self._forecast_results.get(key)
+        if previous is not None and previous[0] == digest:
+            logger.debug("Forecast for %s not changed.", postCode)
+            return previous[1]
 
+        try:
+            forecastJson = _json_loads(payload)
+        except ValueError:
+            logger.error("Invalid forecast JSON for %s.", postCode, exc_info=1)
+            # Don't serve the broken body again from the payload cache.
+            self._forecast_cache.pop(key, None)
+            return None
+        logger.debug("Forecast JSON: %s", forecastJson)
+        forecast = self._parse_forecast(forecastJson)
+        self._forecast_results[key] = (digest, forecast)
+        return forecast
+
+    def _parse_forecast(self, forecastJson) -> WeatherForecast:
         currentState = self._get_current_state(forecastJson)
         dailyForecast = self._get_daily_forecast(forecastJson)
         hourlyForecast = self._get_hourly_forecast(forecastJson)
@@ -181,12 +296,12 @@ class MeteoClient(object):
         sunrises = None
         sunriseJson = forecastJson.get("graph", {}).get("sunrise", None)
         if sunriseJson is not None:
-            sunrises = [datetime.fromtimestamp(epoch / 1000, UTC) for epoch in sunriseJson]
+            sunrises = _parse_epoch_ms_list(sunriseJson)
 
         sunsets = None
         sunsetJson = forecastJson.get("graph", {}).get("sunset", None)
         if sunsetJson is not None:
-            sunsets = [datetime.fromtimestamp(epoch / 1000, UTC) for epoch in sunsetJson]
+            sunsets = _parse_epoch_ms_list(sunsetJson)
 
         return WeatherForecast(currentState, dailyForecast, hourlyForecast, sunrises, sunsets)
 
@@ -195,12 +310,14 @@ class MeteoClient(object):
             return None
 
         currentIcon = to_int(forecastJson.get('currentWeather', {}).get('icon', None))
-        currentCondition = None
-        if currentIcon is not None:
-            currentCondition = ICON_TO_CONDITION_MAP.get(currentIcon)
+        currentCondition = icon_to_condition(currentIcon)
+        currentTime = None
+        currentTimeEpoch = to_int(forecastJson.get('currentWeather', {}).get('time'))
+        if currentTimeEpoch is not None:
+            currentTime = datetime.fromtimestamp(currentTimeEpoch / 1000, UTC)
         return CurrentState(
-            (to_float(forecastJson.get('currentWeather', {}).get('temperature')), "°C"),
-            currentIcon, currentCondition)
+            to_float(forecastJson.get('currentWeather', {}).get('temperature')),
+            currentIcon, currentCondition, currentTime)
 
     def _get_daily_forecast(self, forecastJson) -> list[Forecast] | None:
         forecast: List[Forecast] = []
@@ -210,12 +327,12 @@ class MeteoClient(object):
         for dailyJson in forecastJson["forecast"]:
             timestamp = None
             if "dayDate" in dailyJson:
-                timestamp = datetime.strptime(dailyJson["dayDate"], '%Y-%m-%d')
+                timestamp = datetime.fromisoformat(dailyJson["dayDate"])
             icon = to_int(dailyJson.get('iconDay', None))
-            condition = ICON_TO_CONDITION_MAP.get(icon)
-            temperatureMax = (to_float(dailyJson.get('temperatureMax', None)), "°C")
-            temperatureMin = (to_float(dailyJson.get('temperatureMin', None)), "°C")
-            precipitation = (to_float(dailyJson.get('precipitation', None)), "mm")
+            condition = icon_to_condition(icon)
+            temperatureMax = to_float(dailyJson.get('temperatureMax', None))
+            temperatureMin = to_float(dailyJson.get('temperatureMin', None))
+            precipitation = to_float(dailyJson.get('precipitation', None))
             forecast.append(Forecast(timestamp, icon, condition, temperatureMax, temperatureMin, precipitation))
         return forecast
 
@@ -230,52 +347,131 @@ class MeteoClient(object):
         startTimestamp = datetime.fromtimestamp(startTimestampEpoch / 1000, UTC)
 
 
-        forecast = []
-        temperatureMaxList = [ (value, "°C") for value in graphJson.get("temperatureMax1h", [])]
-        temperatureMeanList = [ (value, "°C") for value in graphJson.get("temperatureMean1h", [])]
-        temperatureMinList = [ (value, "°C") for value in graphJson.get("temperatureMin1h", [])]
-        precipitationList = [ (value, "mm") for value in graphJson.get("precipitation1h", [])]
-        windGustSpeedList = [ (value, "km/h") for value in graphJson.get("gustSpeed1h", [])]
-        windSpeedList = [ (value, "km/h") for value in graphJson.get("windSpeed1h", [])]
-
-        # We get icons only once every 3 hours so we need to expand each elemen 3-times to match
-        iconList = list(itertools.chain.from_iterable(itertools.repeat(x, 3) for x in graphJson.get("weatherIcon3h", [])))
-        windDirectionlist = list(itertools.chain.from_iterable(itertools.repeat((x, "°"), 3) for x in graphJson.get("windDirection3h", [])))
+        temperatureMaxList = graphJson.get("temperatureMax1h", [])
+        temperatureMeanList = graphJson.get("temperatureMean1h", [])
+        temperatureMinList = graphJson.get("temperatureMin1h", [])
+        precipitationList = graphJson.get("precipitation1h", [])
+        windGustSpeedList = graphJson.get("gustSpeed1h", [])
+        windSpeedList = graphJson.get("windSpeed1h", [])
+        # We get icons and wind direction only once every 3 hours, so each entry covers 3 hours
+        icon3hList = graphJson.get("weatherIcon3h", [])
+        windDirection3hList = graphJson.get("windDirection3h", [])
 
         # This is the minimum amount of data we have
-        minForecastHours = min(len(temperatureMaxList), len(temperatureMeanList), len(temperatureMinList), len(precipitationList), len(iconList))
-        timestampList = [ startTimestamp + timedelta(hours=value) for value in range(0, minForecastHours) ]
+        minForecastHours = min(len(temperatureMaxList), len(temperatureMeanList), len(temperatureMinList),
+                               len(precipitationList), len(windGustSpeedList), len(windSpeedList),
+                               len(icon3hList) * 3, len(windDirection3hList) * 3)
+
+        # Resolve conditions once per 3 hour bucket, not for every hour
+        condition3hList = [icon_to_condition(icon) for icon in icon3hList]
 
-        for ts, icon, tMax, tMean, tMin, precipitation, windDirection, windSpeed, windGustSpeed in zip(timestampList, iconList, temperatureMaxList,
-                                                        temperatureMeanList, temperatureMinList, precipitationList, windDirectionlist, windSpeedList, windGustSpeedList, strict=False):
-            forecast.append(Forecast(ts, icon, ICON_TO_CONDITION_MAP.get(icon), tMax, tMin, precipitation, windSpeed=windSpeed, windDirection=windDirection,
-                                      windGustSpeed=windGustSpeed, temperatureMean=tMean))
+        forecast = []
+        # Bound to locals as this loop runs for every forecast hour.
+        append = forecast.append
+        _Forecast = Forecast
+        oneHour = timedelta(hours=1)
+        timestamp = startTimestamp
+        for i in range(minForecastHours):
+            bucket = i // 3
+            append(_Forecast(timestamp, icon3hList[bucket], condition3hList[bucket],
+                             temperatureMaxList[i], temperatureMinList[i], precipitationList[i],
+                             windSpeed=windSpeedList[i], windDirection=windDirection3hList[bucket],
+                             windGustSpeed=windGustSpeedList[i], temperatureMean=temperatureMeanList[i]))
+            timestamp += oneHour
         return forecast
 
-    def _get_current_weather_line_for_station(self, station):
+    async def _get_current_weather_line_for_station(self, station):
         if station is None:
             return None
-        return next((row for row in self._get_csv_dictionary_for_url(CURRENT_CONDITION_URL)
-            if row['Station/Location'].casefold() == station.casefold()), None)
-
-    def _get_csv_dictionary_for_url(self, url, encoding='utf-8'):
+        if await self._get_current_condition_rows() is None:
+            return None
+        return self._station_index.get(station.casefold())
+
+    async def _get_current_condition_rows(self) -> list[list[str]] | None:
+        async with self._csv_lock:
+            return await self._load_current_condition_rows()
+
+    async def _load_current_condition_rows(self) -> list[list[str]] | None:
+        now = time.monotonic()
+        if self._csv_cache is not None and now - self._csv_cache[0] < CURRENT_CONDITION_TTL_S:
+            return self._csv_cache[1]
+        if self._csv_cache is None:
+            csv_data = await self._get_csv_rows_for_url(CURRENT_CONDITION_URL)
+        else:
+            csv_data = await self._get_csv_rows_for_url(CURRENT_CONDITION_URL, etag=self._csv_etag,
+                                                        last_modified=self._csv_last_modified)
+        if csv_data is None:
+            if self._csv_cache is None:
+                return None
+            # Keep serving the last rows, the next call tries again.
+            logger.warning("Couldn't revalidate current conditions, using cached data.")
+            return self._csv_cache[1]
+        if csv_data is _CSV_NOT_MODIFIED:
+            logger.debug("Current conditions not modified, using cached data.")
+            self._csv_cache = (now, self._csv_cache[1])
+            return self._csv_cache[1]
+        header, rows = csv_data.header, csv_data.rows
+        self._csv_etag = csv_data.etag
+        self._csv_last_modified = csv_data.last_modified
+        columns = {name: header.index(name) for name in CURRENT_CONDITION_COLUMNS if name in header}
+        self._csv_cache = (now, rows)
+        self._csv_columns = columns
+        station_column = columns.get('Station/Location')
+        self._station_index = {} if station_column is None else {
+            row[station_column].casefold(): row for row in rows if station_column < len(row)}
+        return rows
+
+    async def _get_csv_rows_for_url(self, url, encoding='utf-8', etag: str | None = None,
+                                    last_modified: str | None = None) -> _CsvResponse | None:
+        """Returns the header and data rows of a CSV file, or None if it can't be loaded.
+
+        If validators of a previous response are passed and the file didn't change since,
+        _CSV_NOT_MODIFIED is returned without downloading the file again.
+        """
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
         try:
             logger.debug("Requesting station data...")
-            with requests.get(url, stream = True) as r:
-                lines = (line.decode(encoding) for line in r.iter_lines())
-                yield from csv.DictReader(lines, delimiter=';')
-        except requests.exceptions.RequestException as e:
+            async with self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT) as r:
+                if r.status == 304 and headers:
+                    return _CSV_NOT_MODIFIED
+                r.raise_for_status()
+                text = await r.text(encoding=encoding)
+                response_etag = r.headers.get("ETag")
+                response_last_modified = r.headers.get("Last-Modified")
+            reader = csv.reader(text.splitlines(), delimiter=';')
+            header = next(reader, [])
+            return _CsvResponse(header, [row for row in reader if row], response_etag, response_last_modified)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             logger.error("Connection failure.", exc_info=1)
             return None
 
-    def _get_forecast_json(self, postCode, language):
+    async def _get_forecast_payload(self, postCode: int, language) -> bytes | None:
+        key = (postCode, language)
+        # Concurrent requests for the same forecast wait for a single download.
+        async with self._forecast_locks.setdefault(key, asyncio.Lock()):
+            entry = self._forecast_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                logger.debug("Using cached forecast data for %s.", postCode)
+                return entry[1]
+            payload = await self._fetch_forecast_payload(*key)
+            if payload is not None:
+                self._forecast_cache[key] = (time.monotonic() + FORECAST_TTL_S, payload)
+            return payload
+
+    async def _fetch_forecast_payload(self, postCode: int, language) -> bytes | None:
         try:
-            url = FORECAST_URL.format(int(postCode))
+            url = _forecast_url(postCode)
             logger.debug("Requesting forecast data from %s...", url)
-            return requests.get(url, headers =
+            async with self._session.get(url, timeout=REQUEST_TIMEOUT, headers =
                 { "User-Agent": FORECAST_USER_AGENT,
                     "Accept-Language": language,
-                    "Accept": "application/json" }).json()
-        except requests.exceptions.RequestException as e:
+                    "Accept": "application/json" }) as r:
+                r.raise_for_status()
+                return await r.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             logger.error("Connection failure.", exc_info=1)
             return None
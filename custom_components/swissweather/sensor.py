@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 import logging
+from operator import attrgetter
+import sys
 from typing import Callable
 
 from homeassistant.components.sensor import (
@@ -23,19 +25,22 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import SwissWeatherDataCoordinator
-from .const import CONF_POST_CODE, CONF_STATION_CODE, DOMAIN
+from .const import CONF_POST_CODE, DOMAIN
+from .coordinator import (
+    SwissCurrentStateCoordinator,
+    get_current_coordinator_key,
+    get_device_info_key,
+)
 from .meteo import CurrentWeather
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SwissWeatherSensorEntry:
     key: str
     description: str
@@ -43,26 +48,31 @@ class SwissWeatherSensorEntry:
     native_unit: str
     device_class: SensorDeviceClass
     state_class: SensorStateClass
+    # Built once here and shared by the sensors of all config entries.
+    entity_description: SensorEntityDescription = field(init=False)
 
-def first_or_none(value):
-    if value is None or len(value) < 1:
-        return None
-    return value[0]
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "entity_description",
+                           SensorEntityDescription(key=self.key,
+                                                   name=self.description,
+                                                   native_unit_of_measurement=self.native_unit,
+                                                   device_class=self.device_class,
+                                                   state_class=self.state_class))
 
 SENSORS: list[SwissWeatherSensorEntry] = [
-    SwissWeatherSensorEntry("time", "Time", lambda weather: weather.date, None, SensorDeviceClass.TIMESTAMP, None),
-    SwissWeatherSensorEntry("temperature", "Temperature", lambda weather: first_or_none(weather.airTemperature), UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("precipitation", "Precipitation", lambda weather: first_or_none(weather.precipitation), UnitOfPrecipitationDepth.MILLIMETERS, None, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("sunshine", "Sunshine", lambda weather: first_or_none(weather.sunshine), UnitOfTime.MINUTES, None, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("global_radiation", "Global Radiation", lambda weather: first_or_none(weather.globalRadiation), UnitOfIrradiance.WATTS_PER_SQUARE_METER, None, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("humidity", "Relative Humidity", lambda weather: first_or_none(weather.relativeHumidity), PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("dew_point", "Dew Point", lambda weather: first_or_none(weather.dewPoint), UnitOfTemperature.CELSIUS, None, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("wind_direction", "Wind Direction", lambda weather: first_or_none(weather.windDirection), DEGREE, None, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("wind_speed", "Wind Speed", lambda weather: first_or_none(weather.windSpeed), UnitOfSpeed.KILOMETERS_PER_HOUR, SensorDeviceClass.SPEED, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("gust_peak1s", "Wind Gusts - Peak 1s", lambda weather: first_or_none(weather.gustPeak1s), UnitOfSpeed.KILOMETERS_PER_HOUR, SensorDeviceClass.SPEED, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("pressure", "Air Pressure", lambda weather: first_or_none(weather.pressureStationLevel), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("pressure_qff", "Air Pressure - Sea Level (QFF)", lambda weather: first_or_none(weather.pressureSeaLevel), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT),
-    SwissWeatherSensorEntry("pressure_qnh", "Air Pressure - Sea Level (QNH)", lambda weather: first_or_none(weather.pressureSeaLevelAtStandardAtmosphere), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT)
+    SwissWeatherSensorEntry("time", "Time", attrgetter("date"), None, SensorDeviceClass.TIMESTAMP, None),
+    SwissWeatherSensorEntry("temperature", "Temperature", attrgetter("airTemperature"), UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("precipitation", "Precipitation", attrgetter("precipitation"), UnitOfPrecipitationDepth.MILLIMETERS, None, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("sunshine", "Sunshine", attrgetter("sunshine"), UnitOfTime.MINUTES, None, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("global_radiation", "Global Radiation", attrgetter("globalRadiation"), UnitOfIrradiance.WATTS_PER_SQUARE_METER, None, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("humidity", "Relative Humidity", attrgetter("relativeHumidity"), PERCENTAGE, SensorDeviceClass.HUMIDITY, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("dew_point", "Dew Point", attrgetter("dewPoint"), UnitOfTemperature.CELSIUS, None, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("wind_direction", "Wind Direction", attrgetter("windDirection"), DEGREE, None, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("wind_speed", "Wind Speed", attrgetter("windSpeed"), UnitOfSpeed.KILOMETERS_PER_HOUR, SensorDeviceClass.SPEED, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("gust_peak1s", "Wind Gusts - Peak 1s", attrgetter("gustPeak1s"), UnitOfSpeed.KILOMETERS_PER_HOUR, SensorDeviceClass.SPEED, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("pressure", "Air Pressure", attrgetter("pressureStationLevel"), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("pressure_qff", "Air Pressure - Sea Level (QFF)", attrgetter("pressureSeaLevel"), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT),
+    SwissWeatherSensorEntry("pressure_qnh", "Air Pressure - Sea Level (QNH)", attrgetter("pressureSeaLevelAtStandardAtmosphere"), UnitOfPressure.HPA, SensorDeviceClass.PRESSURE, SensorStateClass.MEASUREMENT)
 ]
 
 async def async_setup_entry(
@@ -70,32 +80,29 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: SwissWeatherDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: SwissCurrentStateCoordinator = hass.data[DOMAIN][get_current_coordinator_key(config_entry.entry_id)]
     postCode: str = config_entry.data[CONF_POST_CODE]
-    stationCode: str = config_entry.data.get(CONF_STATION_CODE)
-    entities: list[SwissWeatherSensor] = [SwissWeatherSensor(postCode, stationCode, sensorEntry, coordinator) for sensorEntry in SENSORS]
+    deviceInfo: DeviceInfo = hass.data[DOMAIN][get_device_info_key(config_entry.entry_id)]
+    entities: list[SwissWeatherSensor] = [SwissWeatherSensor(postCode, deviceInfo, sensorEntry, coordinator) for sensorEntry in SENSORS]
     async_add_entities(entities)
 
-class SwissWeatherSensor(CoordinatorEntity[SwissWeatherDataCoordinator], SensorEntity):
-    def __init__(self, post_code:str, station_code:str, sensor_entry:SwissWeatherSensorEntry, coordinator:SwissWeatherDataCoordinator) -> None:
+class SwissWeatherSensor(CoordinatorEntity[SwissCurrentStateCoordinator], SensorEntity):
+    def __init__(self, post_code:str, device_info:DeviceInfo, sensor_entry:SwissWeatherSensorEntry, coordinator:SwissCurrentStateCoordinator) -> None:
         super().__init__(coordinator)
-        self.entity_description = SensorEntityDescription(key=sensor_entry.key,
-                                                          name=sensor_entry.description,
-                                                          native_unit_of_measurement=sensor_entry.native_unit,
-                                                          device_class=sensor_entry.device_class,
-                                                          state_class=sensor_entry.state_class)
+        self.entity_description = sensor_entry.entity_description
         self._sensor_entry = sensor_entry
-        if station_code is None:
-            id_combo = f"{post_code}"
-        else:
-            id_combo = f"{post_code}-{station_code}"
-        self._attr_name = f"{sensor_entry.description} at {post_code}"
-        self._attr_unique_id = f"{post_code}.{sensor_entry.key}"
-        self._attr_device_info = DeviceInfo(entry_type=DeviceEntryType.SERVICE, name=f"MeteoSwiss at {id_combo}", identifiers={(DOMAIN, f"swissweather-{id_combo}")})
+        self._attr_name = sys.intern(f"{sensor_entry.description} at {post_code}")
+        self._attr_unique_id = sys.intern(f"{post_code}.{sensor_entry.key}")
+        self._attr_device_info = device_info
+        self._attr_native_value = self._get_native_value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # State is read far more often than the coordinator updates, so extract the value only once.
+        self._attr_native_value = self._get_native_value()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> StateType | Decimal:
+    def _get_native_value(self) -> StateType | Decimal:
         if self.coordinator.data is None:
             return None
-        currentState = self.coordinator.data[0]
-        return self._sensor_entry.data_function(currentState)
+        return self._sensor_entry.data_function(self.coordinator.data)
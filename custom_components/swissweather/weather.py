@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 import datetime
 import logging
+from operator import attrgetter
+import sys
 
 from homeassistant.components.weather import Forecast, WeatherEntity
 from homeassistant.components.weather.const import WeatherEntityFeature
@@ -12,14 +15,18 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from . import SwissWeatherDataCoordinator
-from .const import CONF_POST_CODE, CONF_STATION_CODE, DOMAIN
+from .const import CONF_POST_CODE, DOMAIN
+from .coordinator import (
+    SwissCurrentStateCoordinator,
+    SwissWeatherDataCoordinator,
+    get_current_coordinator_key,
+    get_device_info_key,
+)
 from .meteo import CurrentWeather, WeatherForecast
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,116 +37,95 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: SwissWeatherDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    current_coordinator: SwissCurrentStateCoordinator = hass.data[DOMAIN][get_current_coordinator_key(config_entry.entry_id)]
     async_add_entities(
         [
-            SwissWeather(coordinator, config_entry.data[CONF_POST_CODE], config_entry.data.get(CONF_STATION_CODE)),
+            SwissWeather(coordinator, current_coordinator, config_entry.data[CONF_POST_CODE],
+                         hass.data[DOMAIN][get_device_info_key(config_entry.entry_id)]),
         ]
     )
 
 class SwissWeather(CoordinatorEntity[SwissWeatherDataCoordinator], WeatherEntity):
 
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_native_precipitation_unit = UnitOfPrecipitationDepth.MILLIMETERS
+    _attr_native_wind_speed_unit = UnitOfSpeed.KILOMETERS_PER_HOUR
+    _attr_native_pressure_unit = UnitOfPressure.HPA
+    _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
+
     def __init__(
         self,
         coordinator: SwissWeatherDataCoordinator,
+        current_coordinator: SwissCurrentStateCoordinator,
         postCode: str,
-        stationCode: str,
+        device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
-        if stationCode is None:
-            id_combo = f"{postCode}"
-        else:
-            id_combo = f"{postCode}-{stationCode}"
+        self._current_coordinator = current_coordinator
         self._postCode = postCode
-        self._attr_device_info = DeviceInfo(entry_type=DeviceEntryType.SERVICE,
-                                            name=f"MeteoSwiss at {id_combo}",
-                                            suggested_area=None,
-                                            identifiers={(DOMAIN, f"swissweather-{id_combo}")})
+        # Formatted once, HA reads these on every state write.
+        self._attr_unique_id = sys.intern(f"swiss_weather.{postCode}")
+        self._attr_name = sys.intern(f"Weather at {postCode}")
+        self._attr_device_info = device_info
+        # Forecast entries converted for HA, reused until the forecast changes.
+        self._rendered_source: WeatherForecast | None = None
+        self._rendered_daily: list[Forecast] = []
+        self._rendered_hourly: list[Forecast] = []
+        self._update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # Forecast comes from our own coordinator, current state is polled separately.
+        self.async_on_remove(
+            self._current_coordinator.async_add_listener(self._handle_coordinator_update)
+        )
 
     @property
     def _current_state(self) -> CurrentWeather:
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data[0]
+        return self._current_coordinator.data
 
     @property
     def _current_forecast(self) -> WeatherForecast:
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data[1]
-
-    @property
-    def unique_id(self) -> str | None:        
-        return f"swiss_weather.{self._postCode}"
-
-    @property
-    def name(self):        
-        return f"Weather at {self._postCode}"
-
-    @property
-    def condition(self) -> str | None:
-        if self._current_forecast is None:
-            return None
-        return self._current_forecast.current.currentCondition
-
-    @property
-    def native_temperature(self) -> float | None:
-        if self._current_state is not None and self._current_state.airTemperature is not None:
-            return self._current_state.airTemperature[0]
-        if self._current_forecast is None:
-            return None
-        return self._current_forecast.current.currentTemperature[0]
-
-    @property
-    def native_temperature_unit(self) -> str | None:
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def native_precipitation_unit(self) -> str | None:
-        return UnitOfPrecipitationDepth.MILLIMETERS
-
-    @property
-    def native_wind_speed(self) -> float | None:
-        if self._current_state is not None:
-            return self._current_state.windSpeed[0]
-        return None
-
-    @property
-    def native_wind_speed_unit(self) -> str | None:
-        return UnitOfSpeed.KILOMETERS_PER_HOUR
-
-    @property
-    def humidity(self) -> float | None:
-        if self._current_state is None:
-            return None
-        return self._current_state.relativeHumidity[0]
-
-    @property
-    def wind_bearing(self) -> float | str | None:
-        if self._current_state is None:
-            return None
-        return self._current_state.windDirection[0]
-
-    @property
-    def native_pressure(self) -> float | None:
-        if self._current_state is None:
-            return None
-        return self._current_state.pressureStationLevel[0]
-
-    @property
-    def native_pressure_unit(self) -> str | None:
-        return UnitOfPressure.HPA
-
-    @property
-    def supported_features(self) -> int | None:
-        return WeatherEntityFeature.FORECAST_HOURLY | WeatherEntityFeature.FORECAST_DAILY
+        return self.coordinator.data
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # Either coordinator changed, refresh the cached state before writing it.
+        self._update_attrs()
+        super()._handle_coordinator_update()
+
+    def _update_attrs(self) -> None:
+        current_state = self._current_state
+        current_forecast = self._current_forecast
+        if current_forecast is None:
+            self._attr_condition = None
+            forecast_temperature = None
+        else:
+            self._attr_condition = current_forecast.current.currentCondition
+            forecast_temperature = current_forecast.current.currentTemperature
+        if current_state is None:
+            self._attr_native_temperature = forecast_temperature
+            self._attr_native_wind_speed = None
+            self._attr_humidity = None
+            self._attr_wind_bearing = None
+            self._attr_native_pressure = None
+        else:
+            if current_state.airTemperature is not None:
+                self._attr_native_temperature = current_state.airTemperature
+            else:
+                self._attr_native_temperature = forecast_temperature
+            self._attr_native_wind_speed = current_state.windSpeed
+            self._attr_humidity = current_state.relativeHumidity
+            self._attr_wind_bearing = current_state.windDirection
+            self._attr_native_pressure = current_state.pressureStationLevel
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         _LOGGER.debug("Retrieving daily forecast.")
         if self._current_forecast is None:
             _LOGGER.info("No daily forecast available.")
             return None
-        forecast_data = self._current_forecast.dailyForecast
-        return [self.meteo_forecast_to_forecast(entry, False) for entry in forecast_data]
+        self._render_forecasts(self._current_forecast)
+        return self._rendered_daily[:]
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         _LOGGER.debug("Retrieving hourly forecast.")
@@ -147,26 +133,33 @@ class SwissWeather(CoordinatorEntity[SwissWeatherDataCoordinator], WeatherEntity
             _LOGGER.info("No hourly forecast available.")
             return None
         now = datetime.datetime.now(tz=datetime.UTC).replace(minute=0, second=0, microsecond=0)
-        forecast_data = list(filter(lambda forecast: forecast.timestamp >= now, self._current_forecast.hourlyForecast))
-        return [self.meteo_forecast_to_forecast(entry, True) for entry in forecast_data]
+        self._render_forecasts(self._current_forecast)
+        # Hourly entries are ordered by timestamp, so skip the past ones with a binary search.
+        start = bisect_left(self._current_forecast.hourlyForecast, now, key=attrgetter("timestamp"))
+        return self._rendered_hourly[start:]
+
+    def _render_forecasts(self, forecast: WeatherForecast) -> None:
+        """Converts forecast entries only when the coordinator delivered a new forecast."""
+        if forecast is self._rendered_source:
+            return
+        self._rendered_daily = [self.meteo_forecast_to_forecast(entry, False) for entry in forecast.dailyForecast]
+        self._rendered_hourly = [self.meteo_forecast_to_forecast(entry, True) for entry in forecast.hourlyForecast]
+        self._rendered_source = forecast
 
     def meteo_forecast_to_forecast(self, meteo_forecast, isHourly) -> Forecast:
+        # Forecast is a TypedDict, a literal builds the same dict without going through keyword arguments.
+        forecast: Forecast = {
+            "condition": meteo_forecast.condition,
+            "datetime": meteo_forecast.timestamp.isoformat(),
+            "native_precipitation": meteo_forecast.precipitation,
+            "native_templow": meteo_forecast.temperatureMin,
+        }
         if isHourly:
-            temperature = meteo_forecast.temperatureMean[0]
-            wind_speed = meteo_forecast.windSpeed[0]
-            wind_bearing = meteo_forecast.windDirection[0]
-            wind_gust_speed = meteo_forecast.windGustSpeed[0]
+            forecast["native_temperature"] = meteo_forecast.temperatureMean
+            forecast["native_wind_speed"] = meteo_forecast.windSpeed
+            forecast["native_wind_gust_speed"] = meteo_forecast.windGustSpeed
+            forecast["wind_bearing"] = meteo_forecast.windDirection
         else:
-            temperature = meteo_forecast.temperatureMax[0]
-            wind_speed = None
-            wind_bearing = None
-            wind_gust_speed = None
-
-        return Forecast(condition=meteo_forecast.condition,
-                datetime=meteo_forecast.timestamp.isoformat(),
-                native_precipitation=meteo_forecast.precipitation[0],
-                native_temperature=temperature,
-                native_templow=meteo_forecast.temperatureMin[0],
-                native_wind_speed=wind_speed,
-                native_wind_gust_speed=wind_gust_speed,
-                wind_bearing=wind_bearing)
+            # Daily forecasts carry no wind data, so those keys are left out instead of set to None.
+            forecast["native_temperature"] = meteo_forecast.temperatureMax
+        return forecast